@@ -2,6 +2,8 @@
 HWP 보고서 자동 생성 시스템 - FastAPI 메인 애플리케이션
 """
 import os
+import shutil
+import zipfile
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import FileResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
@@ -15,6 +17,7 @@ from utils.claude_client import ClaudeClient
 from utils.hwp_handler import HWPHandler
 from utils.auth import hash_password
 from database import init_db, UserDB
+from models.user import UserCreate, UserUpdate
 from routers import auth_router, reports_router, admin_router
 
 # 환경 변수 로드
@@ -144,7 +147,7 @@ async def generate_report(request: ReportRequest):
         ReportResponse: 생성 결과
     """
     try:
-        logger.info(f"보고서 생성 요청: {request.topic}")
+        logger.info("보고서 생성 요청: %s", request.topic)
 
         # 입력 검증
         if not request.topic or len(request.topic.strip()) < 3:
@@ -171,7 +174,6 @@ async def generate_report(request: ReportRequest):
             os.makedirs("temp", exist_ok=True)
 
             # 간단한 HWPX 템플릿 직접 생성
-            import zipfile
             work_dir = "temp/template_creation"
             os.makedirs(work_dir, exist_ok=True)
             os.makedirs(f"{work_dir}/Contents", exist_ok=True)
@@ -211,7 +213,6 @@ async def generate_report(request: ReportRequest):
                         zipf.write(file_path, arcname)
 
             # 임시 디렉토리 정리
-            import shutil
             shutil.rmtree(work_dir)
             logger.info("기본 템플릿이 생성되었습니다.")
 
@@ -225,7 +226,7 @@ async def generate_report(request: ReportRequest):
         output_path = hwp_handler.generate_report(content)
         filename = os.path.basename(output_path)
 
-        logger.info(f"보고서 생성 완료: {filename}")
+        logger.info("보고서 생성 완료: %s", filename)
 
         return ReportResponse(
             success=True,
@@ -235,15 +236,15 @@ async def generate_report(request: ReportRequest):
         )
 
     except ValueError as e:
-        logger.error(f"설정 오류: {str(e)}")
+        logger.error("설정 오류: %s", e)
         raise HTTPException(status_code=500, detail=f"설정 오류: {str(e)}")
 
     except FileNotFoundError as e:
-        logger.error(f"파일 오류: {str(e)}")
+        logger.error("파일 오류: %s", e)
         raise HTTPException(status_code=500, detail=f"파일 오류: {str(e)}")
 
     except Exception as e:
-        logger.error(f"보고서 생성 중 오류 발생: {str(e)}", exc_info=True)
+        logger.error("보고서 생성 중 오류 발생: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"보고서 생성 중 오류가 발생했습니다: {str(e)}"
@@ -272,7 +273,7 @@ async def download_report(filename: str):
         if ".." in filename or "/" in filename or "\\" in filename:
             raise HTTPException(status_code=400, detail="잘못된 파일명입니다.")
 
-        logger.info(f"파일 다운로드: {filename}")
+        logger.info("파일 다운로드: %s", filename)
 
         return FileResponse(
             path=file_path,
@@ -283,7 +284,7 @@ async def download_report(filename: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"파일 다운로드 중 오류: {str(e)}")
+        logger.error("파일 다운로드 중 오류: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"파일 다운로드 중 오류가 발생했습니다: {str(e)}"
@@ -319,7 +320,7 @@ async def list_reports():
         return {"reports": files}
 
     except Exception as e:
-        logger.error(f"보고서 목록 조회 중 오류: {str(e)}")
+        logger.error("보고서 목록 조회 중 오류: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"보고서 목록 조회 중 오류가 발생했습니다: {str(e)}"
@@ -340,7 +341,6 @@ def init_admin_user():
             return
 
         # 관리자 계정 생성
-        from models.user import UserCreate, UserUpdate
         admin_data = UserCreate(
             email=admin_email,
             username=admin_username,
@@ -354,10 +354,10 @@ def init_admin_user():
         update = UserUpdate(is_active=True, is_admin=True)
         UserDB.update_user(admin_user.id, update)
 
-        logger.info(f"관리자 계정이 생성되었습니다. 이메일: {admin_email}")
+        logger.info("관리자 계정이 생성되었습니다. 이메일: %s", admin_email)
 
     except Exception as e:
-        logger.error(f"관리자 계정 생성 중 오류: {str(e)}")
+        logger.error("관리자 계정 생성 중 오류: %s", e)
 
 
 if __name__ == "__main__":
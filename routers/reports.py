@@ -37,10 +37,6 @@ async def generate_report(
         # 보고서 내용 생성
         content = claude_client.generate_report(request.topic)
 
-        # 토큰 사용량 추출 (Claude API 응답에서)
-        # Note: anthropic SDK의 Message 객체에서 usage 정보 가져오기
-        # 실제 구현 시 claude_client에서 usage 정보를 반환하도록 수정 필요
-
         # HWP 파일 생성
         hwp_handler = HWPHandler(
             template_path=TEMPLATE_PATH,
@@ -62,11 +58,10 @@ async def generate_report(
             file_size=file_size
         )
 
-        # 토큰 사용량 기록 (임시값 - 실제로는 Claude API 응답에서 가져와야 함)
-        # TODO: ClaudeClient를 수정하여 usage 정보를 반환하도록 개선
-        input_tokens = getattr(claude_client, 'last_input_tokens', 0)
-        output_tokens = getattr(claude_client, 'last_output_tokens', 0)
-        total_tokens = input_tokens + output_tokens
+        # 토큰 사용량 기록 (ClaudeClient가 마지막 API 응답의 usage 정보를 보관)
+        input_tokens = claude_client.last_input_tokens
+        output_tokens = claude_client.last_output_tokens
+        total_tokens = claude_client.last_total_tokens
 
         if total_tokens > 0:
             token_usage = TokenUsageCreate(
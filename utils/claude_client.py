@@ -3,7 +3,9 @@ Claude API 클라이언트
 보고서 내용을 생성하기 위한 Claude API 통신 모듈
 """
 import os
+import re
 import logging
+import functools
 from typing import Dict
 from anthropic import Anthropic
 
@@ -14,6 +16,76 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 응답 섹션 구분자 → 보고서 섹션 키 (응답에 나타나는 순서)
+SECTION_MARKERS = [
+    ("[제목]", "title"),
+    ("[배경제목]", "title_background"),
+    ("[배경]", "background"),
+    ("[주요내용제목]", "title_main_content"),
+    ("[주요내용]", "main_content"),
+    ("[결론제목]", "title_conclusion"),
+    ("[결론]", "conclusion"),
+    ("[요약제목]", "title_summary"),
+    ("[요약]", "summary"),
+]
+
+# 섹션 끝 판별용 (어떤 구분자든 다음에 나타나는 위치에서 섹션 종료)
+SECTION_MARKER_PATTERN = re.compile("|".join(re.escape(marker) for marker, _ in SECTION_MARKERS))
+
+# 보고서 생성 프롬프트 ({TOPIC} 자리에 보고서 주제가 들어감)
+REPORT_PROMPT_TEMPLATE = """당신은 금융 기관의 전문 보고서 작성자입니다.
+다음 주제에 대한 금융 업무보고서를 작성해주세요.
+
+주제: {TOPIC}
+
+아래 형식에 맞춰 각 섹션을 작성해주세요:
+
+1. 제목 (간결하고 명확하게)
+2. 배경 섹션 제목 (예: "배경 및 목적", "추진 배경" 등)
+3. 배경 및 목적 (왜 이 보고서가 필요한지 설명)
+4. 주요내용 섹션 제목 (예: "주요 내용", "분석 결과" 등)
+5. 주요 내용 (구체적이고 상세한 분석 및 설명, 3-5개 소제목 포함)
+6. 결론 섹션 제목 (예: "결론 및 제언", "향후 계획" 등)
+7. 결론 및 제언 (요약과 향후 조치사항)
+8. 요약 섹션 제목 (예: "요약", "핵심 요약" 등)
+9. 요약 (2-3문단, 핵심 내용 요약)
+
+각 섹션은 반드시 다음 구분자로 시작해야 합니다:
+[제목]
+[배경제목]
+[배경]
+[주요내용제목]
+[주요내용]
+[결론제목]
+[결론]
+[요약제목]
+[요약]
+
+전문적이고 격식있는 문체로 작성하되, 명확하고 이해하기 쉽게 작성해주세요.
+금융 용어와 데이터를 적절히 활용하여 신뢰성을 높여주세요."""
+
+# 주제 앞뒤의 고정 문자열은 import 시 한 번만 분리
+if "{TOPIC}" not in REPORT_PROMPT_TEMPLATE:
+    raise ValueError("REPORT_PROMPT_TEMPLATE에 {TOPIC} 자리표시자가 없습니다.")
+_REPORT_PROMPT_PREFIX, _REPORT_PROMPT_SUFFIX = REPORT_PROMPT_TEMPLATE.split("{TOPIC}", 1)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_anthropic_client(api_key: str) -> Anthropic:
+    """
+    API 키별 Anthropic SDK 클라이언트를 생성하여 재사용합니다.
+
+    SDK 클라이언트는 스레드 안전하며 HTTP 연결 풀을 가지고 있으므로,
+    요청마다 새로 만들지 않고 공유하여 연결(TLS 핸드셰이크)을 재사용합니다.
+
+    Args:
+        api_key: Claude API 키
+
+    Returns:
+        Anthropic: 공유 SDK 클라이언트
+    """
+    return Anthropic(api_key=api_key)
+
 
 class ClaudeClient:
     """Claude API를 사용하여 보고서 내용을 생성하는 클라이언트"""
@@ -26,7 +98,8 @@ class ClaudeClient:
         if not self.api_key:
             raise ValueError("CLAUDE_API_KEY 환경 변수가 설정되지 않았습니다.")
 
-        self.client = Anthropic(api_key=self.api_key)
+        # SDK 클라이언트는 공유 (토큰 사용량 등 요청별 상태는 인스턴스에 유지)
+        self.client = _get_anthropic_client(self.api_key)
 
         # 토큰 사용량 추적
         self.last_input_tokens = 0
@@ -53,40 +126,11 @@ class ClaudeClient:
                 - conclusion: 결론 및 제언
         """
 
-        prompt = f"""당신은 금융 기관의 전문 보고서 작성자입니다.
-다음 주제에 대한 금융 업무보고서를 작성해주세요.
-
-주제: {topic}
-
-아래 형식에 맞춰 각 섹션을 작성해주세요:
-
-1. 제목 (간결하고 명확하게)
-2. 배경 섹션 제목 (예: "배경 및 목적", "추진 배경" 등)
-3. 배경 및 목적 (왜 이 보고서가 필요한지 설명)
-4. 주요내용 섹션 제목 (예: "주요 내용", "분석 결과" 등)
-5. 주요 내용 (구체적이고 상세한 분석 및 설명, 3-5개 소제목 포함)
-6. 결론 섹션 제목 (예: "결론 및 제언", "향후 계획" 등)
-7. 결론 및 제언 (요약과 향후 조치사항)
-8. 요약 섹션 제목 (예: "요약", "핵심 요약" 등)
-9. 요약 (2-3문단, 핵심 내용 요약)
-
-각 섹션은 반드시 다음 구분자로 시작해야 합니다:
-[제목]
-[배경제목]
-[배경]
-[주요내용제목]
-[주요내용]
-[결론제목]
-[결론]
-[요약제목]
-[요약]
-
-전문적이고 격식있는 문체로 작성하되, 명확하고 이해하기 쉽게 작성해주세요.
-금융 용어와 데이터를 적절히 활용하여 신뢰성을 높여주세요."""
+        prompt = f"{_REPORT_PROMPT_PREFIX}{topic}{_REPORT_PROMPT_SUFFIX}"
 
         try:
-            logger.info(f"Claude API 호출 시작 - 주제: {topic}")
-            logger.info(f"사용 모델: {self.model}")
+            logger.info("Claude API 호출 시작 - 주제: %s", topic)
+            logger.info("사용 모델: %s", self.model)
 
             message = self.client.messages.create(
                 model=self.model,
@@ -96,17 +140,28 @@ class ClaudeClient:
                 ]
             )
 
-            # 응답 텍스트 파싱
-            content = message.content[0].text
-
-            logger.info("=" * 80)
-            logger.info("Claude API 응답 내용:")
-            logger.info("=" * 80)
-            logger.info(content)
-            logger.info("=" * 80)
-
-            logger.info(f"응답 길이: {len(content)} 문자")
-            logger.info(f"토큰 사용량 - Input: {message.usage.input_tokens}, Output: {message.usage.output_tokens}")
+            # 응답 텍스트 파싱 (첫 번째 텍스트 블록만 사용)
+            content = ""
+            for block in message.content:
+                if block.type == "text" and block.text:
+                    content = block.text
+                    break
+            if not content:
+                raise RuntimeError("Claude 응답에 텍스트 블록이 없습니다.")
+
+            # 응답 원문은 디버깅 용도로만 출력
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("=" * 80)
+                logger.debug("Claude API 응답 내용:")
+                logger.debug("=" * 80)
+                logger.debug(content)
+                logger.debug("=" * 80)
+
+            logger.info("응답 길이: %d 문자", len(content))
+            logger.info(
+                "토큰 사용량 - Input: %d, Output: %d",
+                message.usage.input_tokens, message.usage.output_tokens
+            )
 
             # 토큰 사용량 저장
             self.last_input_tokens = message.usage.input_tokens
@@ -115,15 +170,17 @@ class ClaudeClient:
 
             parsed_content = self._parse_report_content(content)
 
-            logger.info("내용 파싱 완료:")
-            for key, value in parsed_content.items():
-                logger.info(f"  - {key}: {len(value)} 문자")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("내용 파싱 완료:")
+                for key, value in parsed_content.items():
+                    logger.debug("  - %s: %d 문자", key, len(value))
 
             return parsed_content
 
         except Exception as e:
-            logger.error(f"Claude API 호출 중 오류 발생: {str(e)}")
-            raise Exception(f"Claude API 호출 중 오류 발생: {str(e)}")
+            logger.error("Claude API 호출 중 오류 발생: %s", e)
+            # 원본 예외 타입과 traceback을 유지하여 호출자가 처리하도록 재발생
+            raise
 
     def _parse_report_content(self, content: str) -> Dict[str, str]:
         """
@@ -135,66 +192,23 @@ class ClaudeClient:
         Returns:
             Dict[str, str]: 파싱된 보고서 섹션
         """
-        sections = {
-            "title": "",
-            "title_background": "",
-            "title_main_content": "",
-            "title_conclusion": "",
-            "title_summary": "",
-            "summary": "",
-            "background": "",
-            "main_content": "",
-            "conclusion": ""
-        }
-
-        # 구분자로 내용 분리
-        parts = content.split("[제목]")
-        if len(parts) > 1:
-            remaining = parts[1]
-
-            # 제목 추출
-            if "[배경제목]" in remaining:
-                sections["title"] = remaining.split("[배경제목]")[0].strip()
-                remaining = "[배경제목]" + remaining.split("[배경제목]")[1]
-
-            # 배경 섹션 제목 추출
-            if "[배경제목]" in remaining and "[배경]" in remaining:
-                sections["title_background"] = remaining.split("[배경제목]")[1].split("[배경]")[0].strip()
-                remaining = "[배경]" + remaining.split("[배경]")[1]
-
-            # 배경 추출
-            if "[배경]" in remaining and "[주요내용제목]" in remaining:
-                sections["background"] = remaining.split("[배경]")[1].split("[주요내용제목]")[0].strip()
-                remaining = "[주요내용제목]" + remaining.split("[주요내용제목]")[1]
-
-            # 주요내용 섹션 제목 추출
-            if "[주요내용제목]" in remaining and "[주요내용]" in remaining:
-                sections["title_main_content"] = remaining.split("[주요내용제목]")[1].split("[주요내용]")[0].strip()
-                remaining = "[주요내용]" + remaining.split("[주요내용]")[1]
-
-            # 주요내용 추출
-            if "[주요내용]" in remaining and "[결론제목]" in remaining:
-                sections["main_content"] = remaining.split("[주요내용]")[1].split("[결론제목]")[0].strip()
-                remaining = "[결론제목]" + remaining.split("[결론제목]")[1]
-
-            # 결론 섹션 제목 추출
-            if "[결론제목]" in remaining and "[결론]" in remaining:
-                sections["title_conclusion"] = remaining.split("[결론제목]")[1].split("[결론]")[0].strip()
-                remaining = "[결론]" + remaining.split("[결론]")[1]
-
-            # 결론 추출
-            if "[결론]" in remaining and "[요약제목]" in remaining:
-                sections["conclusion"] = remaining.split("[결론]")[1].split("[요약제목]")[0].strip()
-                remaining = "[요약제목]" + remaining.split("[요약제목]")[1]
-
-            # 요약 섹션 제목 추출
-            if "[요약제목]" in remaining and "[요약]" in remaining:
-                sections["title_summary"] = remaining.split("[요약제목]")[1].split("[요약]")[0].strip()
-                remaining = "[요약]" + remaining.split("[요약]")[1]
-
-            # 요약 추출
-            if "[요약]" in remaining:
-                sections["summary"] = remaining.split("[요약]")[1].strip()
+        sections = {key: "" for _, key in SECTION_MARKERS}
+
+        # 구분자 위치를 응답 순서대로 탐색 (내용 시작 위치, 섹션 키)
+        found = []
+        position = 0
+        for marker, key in SECTION_MARKERS:
+            index = content.find(marker, position)
+            if index == -1:
+                continue
+            position = index + len(marker)
+            found.append((position, key))
+
+        # 각 섹션은 다음에 나타나는 구분자(반복된 구분자 포함) 직전까지의 내용
+        for start, key in found:
+            next_marker = SECTION_MARKER_PATTERN.search(content, start)
+            end = next_marker.start() if next_marker else len(content)
+            sections[key] = content[start:end].strip()
 
         # 빈 섹션이 있는지 확인
         for key, value in sections.items():
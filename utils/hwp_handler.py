@@ -3,11 +3,89 @@ HWP 파일 처리 모듈
 HWPX 형식 파일을 열고, 내용을 수정하고, 저장하는 기능 제공
 """
 import os
+import re
+import functools
 import zipfile
 import shutil
-import xml.etree.ElementTree as ET
 from datetime import datetime
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Tuple
+
+# 생성된 단락 뒤에 남는 불완전한 linesegarray 패턴
+# </hp:t></hp:run><hp:linesegarray>...</hp:linesegarray></hp:p>
+LINESEGARRAY_PATTERN = re.compile(
+    r'(</hp:t></hp:run>)<hp:linesegarray>.*?</hp:linesegarray>(</hp:p>)',
+    re.DOTALL
+)
+
+# 단락 구분자: 현재 단락을 닫고 새 <hp:p> 단락을 시작
+PARAGRAPH_SEPARATOR = (
+    '</hp:t></hp:run></hp:p>'
+    '<hp:p id="2147483648" paraPrIDRef="8" styleIDRef="0" pageBreak="0" columnBreak="0" merged="0">'
+    '<hp:run charPrIDRef="21"><hp:t>'
+)
+
+# 단락 텍스트 변환 테이블: XML 특수 문자 이스케이프 및 줄바꿈 → lineBreak 태그
+HWP_TEXT_TRANSLATION = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&apos;',
+    '\n': '<hp:lineBreak/>',
+})
+
+# 작성일 표기 형식
+DATE_FORMAT = "%Y년 %m월 %d일"
+
+# 섹션 제목 기본값 (내용에 없을 때 사용)
+DEFAULT_SECTION_TITLES = {
+    "title_background": "배경 및 목적",
+    "title_main_content": "주요 내용",
+    "title_conclusion": "결론 및 제언",
+    "title_summary": "요약",
+}
+
+# 템플릿 플레이스홀더 → 보고서 내용 키 매핑
+PLACEHOLDER_KEYS = {
+    "{{TITLE}}": "title",
+    "{{TITLE_BACKGROUND}}": "title_background",
+    "{{TITLE_MAIN_CONTENT}}": "title_main_content",
+    "{{TITLE_CONCLUSION}}": "title_conclusion",
+    "{{TITLE_SUMMARY}}": "title_summary",
+    "{{SUMMARY}}": "summary",
+    "{{BACKGROUND}}": "background",
+    "{{MAIN_CONTENT}}": "main_content",
+    "{{CONCLUSION}}": "conclusion",
+    "{{DATE}}": "date",
+    # 템플릿의 오타 지원 (SUMARY -> SUMMARY)
+    "{{SUMARY}}": "summary",
+    "{{TITLE_SUMARY}}": "title_summary",
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_template_entries(template_path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, bytes], ...]:
+    """
+    템플릿 HWPX의 엔트리를 (이름, 내용) 튜플로 읽어 캐시합니다.
+
+    mtime_ns와 size는 캐시 키로만 사용되며, 템플릿 파일이 교체되면
+    새로 읽어옵니다.
+
+    Args:
+        template_path: HWPX 템플릿 파일 경로
+        mtime_ns: 템플릿 파일 수정 시각 (나노초)
+        size: 템플릿 파일 크기
+
+    Returns:
+        Tuple[Tuple[str, bytes], ...]: 템플릿 엔트리 목록 (디렉토리 제외, 원본 순서)
+    """
+    with zipfile.ZipFile(template_path, 'r') as template_zip:
+        return tuple(
+            (info.filename, template_zip.read(info))
+            for info in template_zip.infolist()
+            if not info.is_dir()
+        )
 
 
 class HWPHandler:
@@ -26,6 +104,17 @@ class HWPHandler:
         self.temp_dir = temp_dir
         self.output_dir = output_dir
 
+        # DEFLATE 압축 레벨 (1: 가장 빠름 ~ 9: 가장 작음)
+        compress_level = os.getenv("HWPX_COMPRESS_LEVEL", "1")
+        try:
+            self.compress_level = int(compress_level)
+        except ValueError:
+            self.compress_level = None
+        if self.compress_level is None or not 1 <= self.compress_level <= 9:
+            raise ValueError(
+                f"HWPX_COMPRESS_LEVEL은 1~9 사이의 정수여야 합니다: {compress_level}"
+            )
+
         if not os.path.exists(template_path):
             raise FileNotFoundError(f"템플릿 파일을 찾을 수 없습니다: {template_path}")
 
@@ -36,6 +125,9 @@ class HWPHandler:
         """
         템플릿을 기반으로 보고서를 생성합니다.
 
+        템플릿 HWPX(ZIP)를 디스크에 풀지 않고 엔트리 단위로 읽어,
+        Contents 디렉토리의 XML만 치환한 뒤 출력 파일에 바로 기록합니다.
+
         Args:
             content: 보고서 내용 딕셔너리
                 - title: 제목
@@ -48,119 +140,118 @@ class HWPHandler:
         Returns:
             str: 생성된 파일 경로
         """
+        # 생성 시각 (파일명, 작성일에 공통 사용)
+        generated_at = datetime.now()
+
         # 출력 파일명 생성
         if not output_filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
             output_filename = f"report_{timestamp}.hwpx"
 
         output_path = os.path.join(self.output_dir, output_filename)
 
-        # 임시 작업 디렉토리 생성
-        work_dir = os.path.join(self.temp_dir, f"work_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
-        os.makedirs(work_dir, exist_ok=True)
+        placeholders = self._build_placeholders(content, generated_at)
 
+        # 템플릿 엔트리 (파일이 바뀌지 않았다면 캐시에서 재사용)
+        stat = os.stat(self.template_path)
+        entries = _load_template_entries(self.template_path, stat.st_mtime_ns, stat.st_size)
+        if not any(name.startswith("Contents/") for name, _ in entries):
+            raise FileNotFoundError("Contents 디렉토리를 찾을 수 없습니다.")
+
+        # 작성 중인 파일이 목록/다운로드에 노출되지 않도록 임시 파일에 기록한 뒤 교체
+        partial_path = output_path + ".tmp"
         try:
-            # 1. HWPX 파일 압축 해제
-            self._extract_hwpx(self.template_path, work_dir)
+            with zipfile.ZipFile(partial_path, 'w', zipfile.ZIP_DEFLATED,
+                                 compresslevel=self.compress_level) as output_zip:
+                # 1. mimetype 파일을 먼저 압축하지 않고 추가 (HWPX 표준)
+                for name, data in entries:
+                    if name == 'mimetype':
+                        output_zip.writestr('mimetype', data, compress_type=zipfile.ZIP_STORED)
+                        break
+
+                # 2. 나머지 엔트리 복사 (Contents/*.xml은 플레이스홀더 치환)
+                for name, data in entries:
+                    if name == 'mimetype':
+                        continue
 
-            # 2. 내용 치환
-            self._replace_content(work_dir, content)
+                    if name.startswith("Contents/") and name.endswith('.xml'):
+                        data = self._replace_in_xml(data, placeholders)
 
-            # 3. 다시 압축
-            self._compress_to_hwpx(work_dir, output_path)
+                    output_zip.writestr(name, data)
 
-            return output_path
+            os.replace(partial_path, output_path)
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
 
-        finally:
-            # 임시 디렉토리 정리
-            if os.path.exists(work_dir):
-                shutil.rmtree(work_dir)
+        return output_path
 
-    def _extract_hwpx(self, hwpx_path: str, extract_dir: str):
+    def _build_placeholders(self, content: Dict[str, str], generated_at: datetime) -> Dict[str, str]:
         """
-        HWPX 파일을 압축 해제합니다.
+        템플릿 플레이스홀더별 치환 값을 HWP XML 형식으로 미리 만듭니다.
+
+        같은 내용 키를 가리키는 플레이스홀더(SUMMARY/SUMARY 등)는
+        한 번만 포맷팅합니다.
 
         Args:
-            hwpx_path: HWPX 파일 경로
-            extract_dir: 압축 해제 디렉토리
-        """
-        with zipfile.ZipFile(hwpx_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_dir)
+            content: 보고서 내용
+            generated_at: 보고서 생성 시각
 
-    def _replace_content(self, work_dir: str, content: Dict[str, str]):
+        Returns:
+            Dict[str, str]: 플레이스홀더 → 포맷팅된 치환 값
         """
-        압축 해제된 HWPX의 XML 파일에서 플레이스홀더를 실제 내용으로 치환합니다.
+        # 작성일 추가
+        values = dict(content, date=generated_at.strftime(DATE_FORMAT))
 
-        Args:
-            work_dir: 작업 디렉토리
-            content: 치환할 내용
-        """
-        # 현재 날짜 추가
-        content["date"] = datetime.now().strftime("%Y년 %m월 %d일")
+        formatted = {}
+        placeholders = {}
+        for placeholder, key in PLACEHOLDER_KEYS.items():
+            if key not in formatted:
+                value = values.get(key, DEFAULT_SECTION_TITLES.get(key, ""))
+                # 줄바꿈을 XML 형식에 맞게 변환
+                formatted[key] = self._format_for_hwp(value)
+            placeholders[placeholder] = formatted[key]
 
-        # Contents 디렉토리 내의 모든 XML 파일 처리
-        contents_dir = os.path.join(work_dir, "Contents")
-        if not os.path.exists(contents_dir):
-            raise FileNotFoundError("Contents 디렉토리를 찾을 수 없습니다.")
+        return placeholders
 
-        # 플레이스홀더 매핑
-        placeholders = {
-            "{{TITLE}}": content.get("title", ""),
-            "{{TITLE_BACKGROUND}}": content.get("title_background", "배경 및 목적"),
-            "{{TITLE_MAIN_CONTENT}}": content.get("title_main_content", "주요 내용"),
-            "{{TITLE_CONCLUSION}}": content.get("title_conclusion", "결론 및 제언"),
-            "{{TITLE_SUMMARY}}": content.get("title_summary", "요약"),
-            "{{SUMMARY}}": content.get("summary", ""),
-            "{{BACKGROUND}}": content.get("background", ""),
-            "{{MAIN_CONTENT}}": content.get("main_content", ""),
-            "{{CONCLUSION}}": content.get("conclusion", ""),
-            "{{DATE}}": content.get("date", ""),
-            # 템플릿의 오타 지원 (SUMARY -> SUMMARY)
-            "{{SUMARY}}": content.get("summary", ""),
-            "{{TITLE_SUMARY}}": content.get("title_summary", "요약")
-        }
-
-        # 모든 XML 파일 순회
-        for root_dir, dirs, files in os.walk(contents_dir):
-            for filename in files:
-                if filename.endswith('.xml'):
-                    file_path = os.path.join(root_dir, filename)
-                    self._replace_in_file(file_path, placeholders)
-
-    def _replace_in_file(self, file_path: str, placeholders: Dict[str, str]):
+    def _replace_in_xml(self, data: bytes, placeholders: Dict[str, str]) -> bytes:
         """
-        파일 내용에서 플레이스홀더를 치환합니다.
+        XML 엔트리 내용에서 플레이스홀더를 치환합니다.
 
         Args:
-            file_path: 파일 경로
-            placeholders: 치환할 플레이스홀더 딕셔너리
+            data: XML 엔트리 원본 바이트
+            placeholders: 플레이스홀더 → 포맷팅된 치환 값
+
+        Returns:
+            bytes: 치환된 XML 바이트 (변경사항이 없으면 원본 그대로)
         """
         try:
-            # 파일을 텍스트로 읽어서 치환 (XML 파싱 대신 단순 텍스트 치환)
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # 플레이스홀더 치환
-            modified = False
-            for placeholder, value in placeholders.items():
-                if placeholder in content:
-                    # 줄바꿈을 XML 형식에 맞게 변환
-                    value_formatted = self._format_for_hwp(value)
-                    content = content.replace(placeholder, value_formatted)
-                    modified = True
-
-            # 변경사항이 있으면 파일에 쓰기
-            if modified:
-                # 생성된 <hp:p> 태그들 중 중간 단락들의 linesegarray 제거
-                # (한글이 파일을 열 때 자동으로 재계산하도록)
-                content = self._clean_linesegarray(content)
-
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-
-        except Exception as e:
-            # XML 파싱 에러는 무시 (바이너리 파일일 수 있음)
-            pass
+            # 텍스트로 디코딩하여 치환 (XML 파싱 대신 단순 텍스트 치환)
+            content = data.decode('utf-8')
+        except UnicodeDecodeError:
+            # 텍스트가 아닌 파일은 그대로 유지
+            return data
+
+        # 플레이스홀더가 전혀 없는 파일(header.xml 등)은 바로 건너뜀
+        if "{{" not in content:
+            return data
+
+        # 플레이스홀더 치환
+        modified = False
+        for placeholder, value in placeholders.items():
+            if placeholder in content:
+                content = content.replace(placeholder, value)
+                modified = True
+
+        if not modified:
+            return data
+
+        # 생성된 <hp:p> 태그들 중 중간 단락들의 linesegarray 제거
+        # (한글이 파일을 열 때 자동으로 재계산하도록)
+        content = self._clean_linesegarray(content)
+
+        return content.encode('utf-8')
 
     def _clean_linesegarray(self, content: str) -> str:
         """
@@ -175,15 +266,9 @@ class HWPHandler:
         Returns:
             str: linesegarray가 정리된 XML 내용
         """
-        import re
-
         # 우리가 생성한 <hp:p> 태그들 중에서 linesegarray를 제거
-        # 패턴: </hp:t></hp:run><hp:linesegarray>...</hp:linesegarray></hp:p>
         # → </hp:t></hp:run></hp:p>로 변경
-        pattern = r'(</hp:t></hp:run>)<hp:linesegarray>.*?</hp:linesegarray>(</hp:p>)'
-        content = re.sub(pattern, r'\1\2', content, flags=re.DOTALL)
-
-        return content
+        return LINESEGARRAY_PATTERN.sub(r'\1\2', content)
 
     def _format_for_hwp(self, text: str) -> str:
         """
@@ -205,36 +290,13 @@ class HWPHandler:
         formatted_paragraphs = []
         for para in paragraphs:
             if para.strip():  # 빈 단락 제외
-                # 단락 내부의 단일 줄바꿈을 <hp:lineBreak/>로 변환
-                para = para.replace('\n', '___SINGLE_LINEBREAK___')
-
-                # 특수 문자 이스케이프
-                para = para.replace('&', '&amp;')
-                para = para.replace('<', '&lt;')
-                para = para.replace('>', '&gt;')
-                para = para.replace('"', '&quot;')
-                para = para.replace("'", '&apos;')
-
-                # 단일 줄바꿈을 lineBreak 태그로 변환
-                para = para.replace('___SINGLE_LINEBREAK___', '<hp:lineBreak/>')
-
-                formatted_paragraphs.append(para)
+                # 특수 문자 이스케이프 + 단일 줄바꿈을 <hp:lineBreak/>로 변환 (한 번의 패스)
+                formatted_paragraphs.append(para.translate(HWP_TEXT_TRANSLATION))
 
         # 3. 각 단락을 </hp:t></hp:run></hp:p><hp:p ...><hp:run ...><hp:t> 패턴으로 연결
-        if len(formatted_paragraphs) == 0:
-            return ''
-        elif len(formatted_paragraphs) == 1:
-            return formatted_paragraphs[0]
-        else:
-            # 여러 단락을 별도의 <hp:p> 태그로 분리
-            # 템플릿의 각 플레이스홀더 뒤에 빈 <hp:p> 태그가 있으므로 이를 활용
-            # 단락 구분: </hp:t></hp:run></hp:p><hp:p id="2147483648" paraPrIDRef="8" styleIDRef="0" pageBreak="0" columnBreak="0" merged="0"><hp:run charPrIDRef="21"><hp:t>
-            result = formatted_paragraphs[0]
-            for para in formatted_paragraphs[1:]:
-                # 단락 구분자: 현재 단락 닫고 새 단락 시작
-                result += '</hp:t></hp:run></hp:p><hp:p id="2147483648" paraPrIDRef="8" styleIDRef="0" pageBreak="0" columnBreak="0" merged="0"><hp:run charPrIDRef="21"><hp:t>' + para
-
-            return result
+        # 여러 단락을 별도의 <hp:p> 태그로 분리 (한 번의 join으로 결과 문자열 생성)
+        # 템플릿의 각 플레이스홀더 뒤에 빈 <hp:p> 태그가 있으므로 이를 활용
+        return PARAGRAPH_SEPARATOR.join(formatted_paragraphs)
 
     def _compress_to_hwpx(self, work_dir: str, output_path: str):
         """
@@ -246,22 +308,23 @@ class HWPHandler:
             work_dir: 작업 디렉토리
             output_path: 출력 HWPX 파일 경로
         """
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        work_path = Path(work_dir)
+        mimetype_path = work_path / 'mimetype'
+
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED,
+                             compresslevel=self.compress_level) as zipf:
             # 1. mimetype 파일을 먼저 압축하지 않고 추가 (HWPX 표준)
-            mimetype_path = os.path.join(work_dir, 'mimetype')
-            if os.path.exists(mimetype_path):
+            if mimetype_path.is_file():
                 zipf.write(mimetype_path, 'mimetype', compress_type=zipfile.ZIP_STORED)
 
             # 2. 나머지 파일들을 압축하여 추가
-            for root, dirs, files in os.walk(work_dir):
-                for file in files:
-                    # mimetype은 이미 추가했으므로 건너뛰기
-                    if file == 'mimetype' and root == work_dir:
-                        continue
+            for file_path in work_path.rglob('*'):
+                # 디렉토리와 이미 추가한 mimetype은 건너뛰기
+                if not file_path.is_file() or file_path == mimetype_path:
+                    continue
 
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, work_dir)
-                    zipf.write(file_path, arcname, compress_type=zipfile.ZIP_DEFLATED)
+                arcname = file_path.relative_to(work_path).as_posix()
+                zipf.write(file_path, arcname)
 
     def create_simple_template(self, output_path: str):
         """